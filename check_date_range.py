@@ -1,27 +1,40 @@
-import pandas as pd
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
 
-# Load the data
-df = pd.read_parquet('africa_russia_events.parquet')
 
-# Convert SQLDATE to datetime
-df['Date'] = pd.to_datetime(df['SQLDATE'], format='%Y%m%d')
+def main(path='africa_russia_events.parquet'):
+    # Memory-map the file so the OS page cache serves it; only the SQLDATE
+    # column pages are decoded
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    sqldate = parquet_file.read(columns=['SQLDATE']).column('SQLDATE').to_numpy()
+    total_events = len(sqldate)
 
-# Check date range
-print("Date range in the data:")
-print(f"Earliest date: {df['Date'].min()}")
-print(f"Latest date: {df['Date'].max()}")
-print(f"Total date span: {(df['Date'].max() - df['Date'].min()).days} days")
+    # SQLDATE is an integer YYYYMMDD, so it can be compared directly without
+    # parsing every row to a datetime. Only the min/max scalars are parsed.
+    earliest = datetime.strptime(str(sqldate.min()), '%Y%m%d')
+    latest_date = datetime.strptime(str(sqldate.max()), '%Y%m%d')
 
-# Calculate 6 months ago from the latest date
-latest_date = df['Date'].max()
-six_months_ago = latest_date - timedelta(days=180)  # Approximately 6 months
+    # Check date range
+    print("Date range in the data:")
+    print(f"Earliest date: {earliest}")
+    print(f"Latest date: {latest_date}")
+    print(f"Total date span: {(latest_date - earliest).days} days")
 
-print(f"\nFor last 6 months filter:")
-print(f"Latest date: {latest_date}")
-print(f"6 months ago: {six_months_ago}")
+    # Calculate 6 months ago from the latest date
+    six_months_ago = latest_date - timedelta(days=180)  # Approximately 6 months
+    cutoff = int(six_months_ago.strftime('%Y%m%d'))
 
-# Check how much data we'll have in the last 6 months
-recent_data = df[df['Date'] >= six_months_ago]
-print(f"\nData in last 6 months: {len(recent_data):,} events ({len(recent_data)/len(df)*100:.1f}% of total)")
-print(f"Date range for recent data: {recent_data['Date'].min()} to {recent_data['Date'].max()}")
\ No newline at end of file
+    print(f"\nFor last 6 months filter:")
+    print(f"Latest date: {latest_date}")
+    print(f"6 months ago: {six_months_ago}")
+
+    # Check how much data we'll have in the last 6 months
+    recent_sqldate = sqldate[sqldate >= cutoff]
+    rmin = datetime.strptime(str(recent_sqldate.min()), '%Y%m%d')
+    rmax = datetime.strptime(str(recent_sqldate.max()), '%Y%m%d')
+    print(f"\nData in last 6 months: {len(recent_sqldate):,} events ({len(recent_sqldate)/total_events*100:.1f}% of total)")
+    print(f"Date range for recent data: {rmin} to {rmax}")
+
+
+if __name__ == '__main__':
+    main()
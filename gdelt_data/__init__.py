@@ -5,6 +5,7 @@ from .collector import (
     save_filter_rules_template,
     load_filter_rules_from_file,
     interactive_filter_builder,
+    encode_code_columns,
     DEFAULT_FILTER_RULES,
 )
 
@@ -33,6 +34,7 @@ from .enrich import (
     add_event_descriptions,
     add_country_names,
     filter_by_country,
+    reformat_dates,
 )
 
 from .export import to_kml
@@ -43,6 +45,7 @@ __all__ = [
     "save_filter_rules_template",
     "load_filter_rules_from_file",
     "interactive_filter_builder",
+    "encode_code_columns",
     "DEFAULT_FILTER_RULES",
     # parsing
     "extract_url_metadata",
@@ -65,6 +68,7 @@ __all__ = [
     "add_event_descriptions",
     "add_country_names",
     "filter_by_country",
+    "reformat_dates",
     # export
     "to_kml",
 ]
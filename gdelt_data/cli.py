@@ -3,11 +3,12 @@ import textwrap
 from datetime import datetime
 
 import pandas as pd
+import pyarrow.parquet as pq
 
 from .collector import (
     collect_gdelt_data,
+    encode_code_columns,
     save_filter_rules_template,
-    interactive_filter_builder,
     DEFAULT_FILTER_RULES,
 )
 from .enrich import add_event_descriptions, add_country_names, filter_by_country
@@ -56,7 +57,10 @@ EXTENDED_HELP = textwrap.dedent("""\
         --filters, -f FILE  Path to a YAML or JSON file with filter rules.
                             If omitted, sensible defaults are applied.
         --batch-size N      Days to accumulate before flushing to disk (default: 7).
+        --rows-per-group N  Also flush once this many rows are buffered; the
+                            maximum Parquet row-group size (default: 262144).
         --sleep SECONDS     Delay between API requests (default: 0.5).
+        --workers N         Days fetched concurrently (default: 4).
         --no-filter         Disable all filtering; collect raw events.
 
     ─── FILTER ─────────────────────────────────────────────────────
@@ -177,8 +181,11 @@ EXTENDED_HELP = textwrap.dedent("""\
 
       The 'filter', 'enrich', and 'extract-urls' subcommands choose their
       format from the output file extension: .csv (default), .parquet, or
-      .ndjson / .jsonl (newline-delimited JSON). Inputs are detected the
-      same way, so steps can be chained in any of these formats.
+      .ndjson / .jsonl (newline-delimited JSON). Text formats are compressed
+      when a .gz/.bz2/.zip/.xz suffix follows (e.g. mali.csv.gz); .zst
+      also works once the optional 'zstandard' package is installed.
+      Inputs are detected the same way, so steps can be chained in any of
+      these formats.
 
     ─── EXAMPLES ───────────────────────────────────────────────────
       # Collect one week with default filters
@@ -277,28 +284,73 @@ FILTER_OPERATORS = {
 }
 
 
-def _read_table(path):
+# Columns read by the subcommands that only need part of a GDELT table
+EXTRACT_URLS_COLUMNS = [
+    'SOURCEURL', 'SQLDATE', 'GoldsteinScale', 'Actor1Name', 'Actor2Name',
+    'Actor1CountryCode', 'Actor2CountryCode', 'ActionGeo_CountryCode',
+    'EventDescription',
+]
+
+KML_COLUMNS = [
+    'ActionGeo_Lat', 'ActionGeo_Long', 'GoldsteinScale', 'EventDescription',
+    'ActionGeo_FullName', 'SOURCEURL', 'DATEADDED', 'MonthYear',
+]
+
+# Suffixes pandas infers compression from; stripped before picking the format
+# so e.g. ``events.ndjson.gz`` is read and written as gzipped NDJSON. ``.zst``
+# needs the optional ``zstandard`` package (not in requirements.txt).
+COMPRESSION_SUFFIXES = ('.gz', '.bz2', '.zip', '.xz', '.zst')
+
+
+def _is_ndjson(path):
+    """True if *path* names an NDJSON file, ignoring a compression suffix."""
+    for suffix in COMPRESSION_SUFFIXES:
+        if path.endswith(suffix):
+            path = path[:-len(suffix)]
+            break
+    return path.endswith(".ndjson") or path.endswith(".jsonl")
+
+
+def _read_table(path, columns=None, filters=None):
     """Read a DataFrame, choosing the reader from the file extension.
 
     Supports ``.parquet``, ``.ndjson``/``.jsonl`` (newline-delimited JSON),
-    and CSV (the default for any other extension).
+    and CSV (the default for any other extension).  Text formats may carry a
+    compression suffix (``.csv.gz``, ``.ndjson.bz2``, ...).  They have the
+    country and CAMEO code columns encoded as categoricals, matching what
+    Parquet files written by ``collect`` already carry.
+
+    When ``columns`` is given, only those of them present in the file are
+    loaded; Parquet and CSV skip decoding the other columns entirely.
+    ``filters`` (pyarrow DNF predicates) are pushed into Parquet reads so
+    non-matching row groups are skipped; text formats ignore them, so
+    callers must still filter the result.
     """
+    wanted = set(columns) if columns is not None else None
     if path.endswith(".parquet"):
-        return pd.read_parquet(path)
-    if path.endswith(".ndjson") or path.endswith(".jsonl"):
-        return pd.read_json(path, orient="records", lines=True)
-    return pd.read_csv(path)
+        if wanted is not None:
+            columns = [c for c in pq.read_schema(path).names if c in wanted]
+        return pd.read_parquet(path, columns=columns, filters=filters)
+    if _is_ndjson(path):
+        df = pd.read_json(path, orient="records", lines=True)
+        if wanted is not None:
+            df = df[[c for c in df.columns if c in wanted]]
+    else:
+        df = pd.read_csv(path, usecols=(lambda c: c in wanted) if wanted is not None else None)
+    return encode_code_columns(df)
 
 
 def _write_table(df, path):
     """Write a DataFrame, choosing the format from the file extension.
 
     ``.parquet`` writes Snappy-compressed Parquet, ``.ndjson``/``.jsonl``
-    writes newline-delimited JSON, and any other extension writes CSV.
+    writes newline-delimited JSON, and any other extension writes CSV.  A
+    trailing compression suffix (``.gz``, ``.bz2``, ...) compresses the text
+    formats as they are written; ``.zst`` requires ``zstandard``.
     """
     if path.endswith(".parquet"):
         df.to_parquet(path, index=False)
-    elif path.endswith(".ndjson") or path.endswith(".jsonl"):
+    elif _is_ndjson(path):
         df.to_json(path, orient="records", lines=True)
     else:
         df.to_csv(path, index=False)
@@ -315,6 +367,8 @@ def _cmd_collect(args):
         output_file=args.output,
         batch_size=args.batch_size,
         sleep_time=args.sleep,
+        max_workers=args.workers,
+        rows_per_group=args.rows_per_group,
     )
 
     if args.no_filter:
@@ -361,12 +415,20 @@ def _cmd_operators(_args):
 
 def _cmd_filter(args):
     """Run the filter subcommand."""
-    df = _read_table(args.input_file)
-
-    print(f"Loaded {len(df):,} events from {args.input_file}")
-    filtered = filter_by_country(df, args.country_code.upper())
+    country_code = args.country_code.upper()
+    df = _read_table(args.input_file,
+                     filters=[("ActionGeo_CountryCode", "==", country_code)])
+
+    # Parquet reads only the matching row groups, so report the file's size
+    # from its footer rather than from what was read
+    if args.input_file.endswith(".parquet"):
+        total = pq.read_metadata(args.input_file).num_rows
+    else:
+        total = len(df)
+    print(f"Loaded {total:,} events from {args.input_file}")
+    filtered = filter_by_country(df, country_code)
     _write_table(filtered, args.output)
-    print(f"Wrote {len(filtered):,} events for {args.country_code.upper()} -> {args.output}")
+    print(f"Wrote {len(filtered):,} events for {country_code} -> {args.output}")
 
 
 def _cmd_enrich(args):
@@ -385,7 +447,7 @@ def _cmd_enrich(args):
 
 def _cmd_extract_urls(args):
     """Run the extract-urls subcommand."""
-    df = _read_table(args.input_file)
+    df = _read_table(args.input_file, columns=EXTRACT_URLS_COLUMNS)
     print(f"Loaded {len(df):,} events from {args.input_file}")
 
     result = get_source_urls_with_metadata(
@@ -406,7 +468,7 @@ def _cmd_extract_urls(args):
 
 def _cmd_kml(args):
     """Run the kml subcommand."""
-    df = _read_table(args.input_file)
+    df = _read_table(args.input_file, columns=KML_COLUMNS)
     print(f"Loaded {len(df):,} events from {args.input_file}")
 
     to_kml(
@@ -463,12 +525,24 @@ def main() -> None:
         default=7,
         help='Days per batch before flushing to disk (default: 7).',
     )
+    collect_parser.add_argument(
+        '--rows-per-group',
+        type=int,
+        default=262144,
+        help='Rows buffered before flushing; max Parquet row-group size (default: 262144).',
+    )
     collect_parser.add_argument(
         '--sleep',
         type=float,
         default=0.5,
         help='Seconds between API requests (default: 0.5).',
     )
+    collect_parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Days fetched concurrently (default: 4).',
+    )
     collect_parser.add_argument(
         '--no-filter',
         action='store_true',
@@ -566,7 +640,7 @@ def main() -> None:
         '--delay',
         type=float,
         default=1.0,
-        help='Seconds between requests per thread (default: 1).',
+        help='Seconds between requests to the same host (default: 1).',
     )
     urls_parser.add_argument(
         '--timeout',
@@ -1,11 +1,30 @@
 import gdelt
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import time
-import gc
 import os
 import json
 import yaml
 import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, reduce
+
+from .country_codes import (
+    load_cameo_country_dict,
+    load_cameo_eventcodes_dict,
+    load_fips_dict,
+)
+
+# Numeric literals accepted in rule values. A decimal point marks a float;
+# anything else that does not match is kept as a string.
+_INT_RE = re.compile(r'^[+-]?\d+$')
+_FLOAT_RE = re.compile(r'^[+-]?(\d+\.\d*|\.\d+)([eE][+-]?\d+)?$')
+
 
 class FilterRuleParser:
     """Parse plaintext filter rules into operations.
@@ -13,23 +32,41 @@ class FilterRuleParser:
     This helper class converts simple text expressions into tuples that
     describe how a pandas ``DataFrame`` should be filtered.
     """
-    
+
+    OPERATORS = {
+        'greater than': '>',
+        'greater than or equal': '>=',
+        'less than': '<',
+        'less than or equal': '<=',
+        'equals': '==',
+        'not equals': '!=',
+        'contains': 'contains',
+        'not contains': 'not contains',
+        'in': 'in',
+        'not in': 'not in',
+        'is null': 'isnull',
+        'is not null': 'notnull',
+        'between': 'between'
+    }
+
+    # One alternation over every operator phrase, longest first so that e.g.
+    # "greater than or equal" is preferred over "greater than", and "not in"
+    # over "in". Operator words may be separated by any run of whitespace;
+    # the match is case-insensitive. The lazy column group makes the first
+    # operator phrase in the text win, so operator words inside a value
+    # (e.g. "Name in [a, contains]") are not mistaken for the operator.
+    _RULE_RE = re.compile(
+        r'^(.*?)\s+('
+        + '|'.join(
+            r'\s+'.join(re.escape(word) for word in op_key.split())
+            for op_key in sorted(OPERATORS, key=len, reverse=True)
+        )
+        + r')\b\s*(.*)$',
+        re.IGNORECASE,
+    )
+
     def __init__(self):
-        self.operators = {
-            'greater than': '>',
-            'greater than or equal': '>=',
-            'less than': '<',
-            'less than or equal': '<=',
-            'equals': '==',
-            'not equals': '!=',
-            'contains': 'contains',
-            'not contains': 'not contains',
-            'in': 'in',
-            'not in': 'not in',
-            'is null': 'isnull',
-            'is not null': 'notnull',
-            'between': 'between'
-        }
+        self.operators = self.OPERATORS
     
     def parse_rule(self, rule_text):
         """Convert a textual rule into its components.
@@ -47,30 +84,20 @@ class FilterRuleParser:
             is a string representation of the comparison operator and ``value``
             is the parsed value (``None`` for null checks).
         """
-        text = rule_text.strip()
-
-        # Match the longest operator phrase first so that e.g.
-        # "greater than or equal" is preferred over "greater than", and
-        # "not in" over "in". Operator words may be separated by any run of
-        # whitespace; the match is case-insensitive.
-        for op_key in sorted(self.operators, key=len, reverse=True):
-            op_regex = r'\s+'.join(re.escape(word) for word in op_key.split())
-            pattern = re.compile(rf'^(.*?)\s+{op_regex}\b\s*(.*)$', re.IGNORECASE)
-            match = pattern.match(text)
-            if not match:
-                continue
+        match = self._RULE_RE.match(rule_text.strip())
+        if not match:
+            raise ValueError(f"Could not parse rule: {rule_text}")
 
-            column = match.group(1).strip()
-            value_text = match.group(2).strip()
-            operator = self.operators[op_key]
+        column = match.group(1).strip()
+        op_key = ' '.join(match.group(2).lower().split())
+        value_text = match.group(3).strip()
+        operator = self.operators[op_key]
 
-            # Null checks take no operand.
-            if operator in ('isnull', 'notnull'):
-                return column, operator, None
+        # Null checks take no operand.
+        if operator in ('isnull', 'notnull'):
+            return column, operator, None
 
-            return column, operator, self._parse_value(value_text)
-
-        raise ValueError(f"Could not parse rule: {rule_text}")
+        return column, operator, self._parse_value(value_text)
     
     def _parse_value(self, value_text):
         """Interpret the value portion of a rule.
@@ -116,15 +143,13 @@ class FilterRuleParser:
         """
         value = value.strip().strip('"\'')
         
-        # Try to convert to number
-        try:
-            if '.' in value:
-                return float(value)
-            else:
-                return int(value)
-        except ValueError:
-            # Return as string
-            return value
+        # Classify with precompiled patterns rather than try/except, which
+        # is comparatively expensive for the (common) non-numeric tokens
+        if _INT_RE.match(value):
+            return int(value)
+        if _FLOAT_RE.match(value):
+            return float(value)
+        return value
 
 def rule_to_query(column, operator, value):
     """Translate a parsed rule into a pandas ``DataFrame.query`` expression.
@@ -166,7 +191,190 @@ def rule_to_query(column, operator, value):
     raise ValueError(f"Unsupported operator: {operator}")
 
 
-def create_filter_function(filter_rules):
+def rule_to_mask(series, operator, value):
+    """Evaluate a parsed rule against a column and return a boolean mask.
+
+    This is the direct (non-``query``) counterpart of :func:`rule_to_query`
+    and follows the same semantics for every operator.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        Column the rule applies to.
+    operator : str
+        Operator symbol/keyword produced by :meth:`FilterRuleParser.parse_rule`.
+    value : object
+        Parsed operand as returned by :meth:`FilterRuleParser.parse_rule`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array with one entry per row of ``series``. Missing
+        comparison results count as ``False``.
+    """
+    mask = _numeric_mask(series, operator, value)
+    if mask is not None:
+        return mask
+
+    if operator in ('==', '!=') and isinstance(series.dtype, pd.CategoricalDtype):
+        mask = _categorical_equal_mask(series, value)
+        return mask if operator == '==' else ~mask
+
+    if (operator in ('>', '>=', '<', '<=', 'between')
+            and isinstance(series.dtype, pd.CategoricalDtype)):
+        # Unordered categoricals do not support ordering comparisons;
+        # compare the underlying values as the uncategorized column would.
+        series = series.astype(series.cat.categories.dtype)
+
+    try:
+        evaluate = _RULE_OPS[operator]
+    except KeyError:
+        raise ValueError(f"Unsupported operator: {operator}") from None
+    return evaluate(series, value)
+
+
+def _as_mask(result):
+    """Convert a pandas boolean result to a numpy mask, treating NA as ``False``."""
+    return result.to_numpy(dtype=bool, na_value=False)
+
+
+def _between_mask(series, value):
+    """Inclusive range mask for a ``(low, high)`` operand."""
+    low, high = value
+    return _as_mask((series >= low) & (series <= high))
+
+
+# Operator -> ``f(series, value)`` returning a numpy boolean mask. Used by
+# :func:`rule_to_mask` once the dtype-specific fast paths have declined.
+_RULE_OPS = {
+    '>': lambda series, value: _as_mask(series > value),
+    '>=': lambda series, value: _as_mask(series >= value),
+    '<': lambda series, value: _as_mask(series < value),
+    '<=': lambda series, value: _as_mask(series <= value),
+    '==': lambda series, value: _as_mask(series == value),
+    '!=': lambda series, value: _as_mask(series != value),
+    'in': lambda series, value: _isin_mask(series, value),
+    'not in': lambda series, value: ~_isin_mask(series, value),
+    'isnull': lambda series, value: _as_mask(series.isnull()),
+    'notnull': lambda series, value: _as_mask(series.notnull()),
+    'between': lambda series, value: _between_mask(series, value),
+    'contains': lambda series, value: _contains_mask(series, value),
+    'not contains': lambda series, value: ~_contains_mask(series, value),
+}
+
+
+_NUMERIC_UFUNCS = {
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '<': np.less,
+    '<=': np.less_equal,
+    '==': np.equal,
+    '!=': np.not_equal,
+}
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _numeric_mask(series, operator, value):
+    """Evaluate a rule on a plain numeric column directly with numpy.
+
+    Comparisons, ``between`` and null checks on numpy-backed int/float
+    columns are computed on the raw array, skipping the pandas ``Series``
+    wrapper and the nullable-to-numpy conversion of its result. ``between``
+    writes both bounds into one output buffer. NaN compares ``False``, as
+    it does through pandas. Returns ``None`` when the fast path does not
+    apply.
+    """
+    dtype = series.dtype
+    if not isinstance(dtype, np.dtype) or dtype.kind not in 'iuf':
+        return None
+
+    arr = series.to_numpy()
+    if operator in _NUMERIC_UFUNCS and _is_number(value):
+        return _NUMERIC_UFUNCS[operator](arr, value)
+    if operator == 'between' and all(_is_number(v) for v in value):
+        low, high = value
+        mask = np.greater_equal(arr, low)
+        mask &= np.less_equal(arr, high)
+        return mask
+    if operator in ('isnull', 'notnull'):
+        if dtype.kind == 'f':
+            missing = np.isnan(arr)
+        else:
+            missing = np.zeros(len(arr), dtype=bool)
+        return missing if operator == 'isnull' else ~missing
+    return None
+
+
+def _categorical_equal_mask(series, value):
+    """Equality mask for a categorical column, compared on integer codes.
+
+    ``value`` is looked up in the categories once and the codes array is
+    compared against that single code. A value that is not a category
+    matches nothing; missing entries (code ``-1``) never match.
+    """
+    code = series.cat.categories.get_indexer(pd.Index([value], dtype=object))[0]
+    if code < 0:
+        return np.zeros(len(series), dtype=bool)
+    return series.cat.codes.to_numpy() == code
+
+
+# Lists at or below this length are matched with chained ``==`` on numeric
+# columns, which beats a hash-based ``isin`` for a handful of values.
+_SHORT_ISIN_LIMIT = 4
+
+
+def _isin_mask(series, values):
+    """Boolean membership mask equivalent to ``series.isin(values)``.
+
+    Categorical columns are matched on their integer codes: the wanted
+    values are translated to codes once and compared against
+    ``series.cat.codes``. Short lists of numbers on numeric columns are
+    matched with OR-ed equality tests. Anything else uses ``isin``.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        wanted = series.cat.categories.get_indexer(pd.Index(values, dtype=object))
+        wanted = wanted[wanted >= 0]
+        return np.isin(series.cat.codes.to_numpy(), wanted)
+
+    if (series.dtype.kind in 'iuf'
+            and 0 < len(values) <= _SHORT_ISIN_LIMIT
+            and all(_is_number(v) for v in values)):
+        arr = series.to_numpy()
+        return reduce(np.logical_or, [arr == v for v in values])
+
+    return series.isin(values).to_numpy(dtype=bool, na_value=False)
+
+
+def _contains_mask(series, pattern):
+    """Case-insensitive regex search mask, like ``str.contains(case=False, na=False)``.
+
+    String columns are searched with pyarrow's ``match_substring_regex``
+    kernel, which runs over the Arrow buffer without boxing a Python string
+    per row. Categorical columns search only their categories and broadcast
+    the result through the codes. Columns or patterns pyarrow cannot handle
+    (mixed-type object columns, regex syntax RE2 does not support) fall back
+    to pandas.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        hits = _contains_mask(pd.Series(series.cat.categories), pattern)
+        codes = series.cat.codes.to_numpy()
+        return np.where(codes >= 0, hits[codes], False)
+
+    try:
+        matched = pc.match_substring_regex(
+            pa.array(series, from_pandas=True), pattern, ignore_case=True
+        )
+        return matched.fill_null(False).to_numpy(zero_copy_only=False)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        return series.str.contains(pattern, case=False, na=False).to_numpy(
+            dtype=bool, na_value=False
+        )
+
+
+def create_filter_function(filter_rules, stats=None):
     """Build a ``DataFrame`` filtering function from text rules.
 
     Parameters
@@ -175,45 +383,162 @@ def create_filter_function(filter_rules):
         Mapping of rule names to rule configurations. Each rule configuration
         must contain a ``"rule"`` key with the textual rule and may include an
         ``"enabled"`` flag.
+    stats : dict, optional
+        When given, the per-call "Applied" and "Filtered" report lines are
+        not printed. Instead ``stats[rule_name]`` accumulates
+        ``[rows_in, rows_kept]`` across calls, where ``rows_in`` counts the
+        rows still selected when the rule was evaluated. Warnings and errors
+        are always printed.
 
     Returns
     -------
     Callable[[pandas.DataFrame], pandas.DataFrame]
         Function that applies all enabled rules to an input ``DataFrame`` and
         returns the filtered frame.
+
+    Notes
+    -----
+    Rules are parsed once, when the function is built, rather than on every
+    call. Unparseable rules are reported at that point and dropped. At call
+    time each applicable rule is evaluated to a boolean mask with
+    :func:`rule_to_mask` and AND-ed into a single cumulative mask, so the
+    frame is sliced (and its columns copied) exactly once. A rule that
+    fails to evaluate is reported and skipped. Several ``not contains``
+    rules on one column are evaluated as a single regex scan (see
+    :func:`_fuse_not_contains`).
+
+    Rules are evaluated cheapest first: equality and membership tests, then
+    range and null checks, then ``contains`` / ``not contains``. The string
+    scans only look at the rows that every earlier rule kept.
     """
     parser = FilterRuleParser()
 
-    def filter_events(df):
-        original_len = len(df)
+    compiled = []
+    for rule_name, rule_config in filter_rules.items():
+        if not rule_config.get('enabled', True):
+            continue
 
-        for rule_name, rule_config in filter_rules.items():
-            if not rule_config.get('enabled', True):
-                continue
+        rule_text = rule_config['rule']
 
-            rule_text = rule_config['rule']
+        try:
+            column, operator, value = parser.parse_rule(rule_text)
+            compiled.append(([(rule_name, rule_text)], column, operator, value))
+        except Exception as e:
+            print(f"    Error parsing rule {rule_name}: {e}")
 
-            try:
-                column, operator, value = parser.parse_rule(rule_text)
+    compiled = _fuse_not_contains(compiled)
 
-                if column not in df.columns:
-                    print(f"    Warning: Column {column} not found for rule: {rule_name}")
-                    continue
+    # Cheapest operators first; the stable sort keeps rule order within a tier
+    ordered = sorted(compiled, key=lambda entry: _RULE_COST.get(entry[2], 1))
+    if ordered != compiled:
+        names = [rule_name for rules, _, _, _ in ordered for rule_name, _ in rules]
+        print(f"    Rules reordered by evaluation cost: {', '.join(names)}")
+    compiled = ordered
 
-                df = df.query(rule_to_query(column, operator, value), engine='python')
-                print(f"    Applied {rule_name}: {rule_text}")
+    def filter_events(df):
+        original_len = len(df)
+        mask = np.ones(original_len, dtype=bool)
 
+        # Report lines are buffered and written with a single print per call
+        log = []
+        for rules, column, operator, value in compiled:
+            if column not in df.columns:
+                for rule_name, _ in rules:
+                    log.append(f"    Warning: Column {column} not found for rule: {rule_name}")
+                continue
+
+            try:
+                rows_in = np.count_nonzero(mask) if stats is not None else None
+                if _RULE_COST.get(operator, 1) >= _NARROWED_COST and not mask.all():
+                    # Only the rows earlier rules kept need the string scan
+                    keep = np.flatnonzero(mask)
+                    mask[keep] = rule_to_mask(df[column].iloc[keep], operator, value)
+                else:
+                    mask &= rule_to_mask(df[column], operator, value)
+                if stats is None:
+                    for rule_name, rule_text in rules:
+                        log.append(f"    Applied {rule_name}: {rule_text}")
+                else:
+                    rows_kept = np.count_nonzero(mask)
+                    for rule_name, _ in rules:
+                        counts = stats.setdefault(rule_name, [0, 0])
+                        counts[0] += rows_in
+                        counts[1] += rows_kept
             except Exception as e:
-                print(f"    Error applying rule {rule_name}: {e}")
+                for rule_name, _ in rules:
+                    log.append(f"    Error applying rule {rule_name}: {e}")
+
+        df = df[mask]
 
         filtered_len = len(df)
-        if original_len > 0:
-            print(f"    Filtered: {original_len} → {filtered_len} events ({filtered_len/original_len*100:.1f}% kept)")
+        if original_len > 0 and stats is None:
+            log.append(f"    Filtered: {original_len} → {filtered_len} events ({filtered_len/original_len*100:.1f}% kept)")
+
+        if log:
+            print('\n'.join(log))
 
         return df
 
     return filter_events
 
+# Relative cost of evaluating each operator over a column. Rules at or above
+# _NARROWED_COST are only evaluated on rows still selected by cheaper rules.
+_RULE_COST = {
+    '==': 0, '!=': 0, 'in': 0, 'not in': 0,
+    '>': 1, '>=': 1, '<': 1, '<=': 1, 'between': 1, 'isnull': 1, 'notnull': 1,
+    'contains': 3, 'not contains': 3,
+}
+_NARROWED_COST = 3
+
+
+def _fuse_not_contains(compiled):
+    """Merge ``not contains`` rules on the same column into one alternation.
+
+    Excluding every row that matches any of the patterns P1..Pn is the same
+    as excluding rows matching ``(?:P1)|...|(?:Pn)``, so the column only has
+    to be scanned once. The merged entry takes the place of the first rule
+    in the group and keeps every member's name for reporting. Patterns with
+    capture groups (whose backreferences would be renumbered) or that do
+    not compile on their own are left as separate rules, so a bad pattern
+    still only disables its own rule.
+
+    ``compiled`` holds ``(rules, column, operator, value)`` entries, where
+    ``rules`` is a list of ``(rule_name, rule_text)`` pairs; the returned
+    list has the same shape and order.
+    """
+    groups = {}
+    for entry in compiled:
+        rules, column, operator, value = entry
+        if operator != 'not contains' or not isinstance(value, str):
+            continue
+        try:
+            if re.compile(value).groups:
+                continue
+        except re.error:
+            continue
+        groups.setdefault(column, []).append(entry)
+
+    fused = {}
+    for column, entries in groups.items():
+        if len(entries) < 2:
+            continue
+        pattern = '|'.join(f'(?:{value})' for _, _, _, value in entries)
+        try:
+            re.compile(pattern)
+        except re.error:
+            continue
+        rules = [rule for entry in entries for rule in entry[0]]
+        fused[id(entries[0])] = (rules, column, 'not contains', pattern)
+        for entry in entries[1:]:
+            fused[id(entry)] = None
+
+    result = []
+    for entry in compiled:
+        replacement = fused.get(id(entry), entry)
+        if replacement is not None:
+            result.append(replacement)
+    return result
+
 # Default filter configuration used when none is provided.
 DEFAULT_FILTER_RULES = {
     "high_mention_events": {
@@ -327,6 +652,10 @@ def save_filter_rules_template(filepath='filter_rules_template.yaml'):
     
     print(f"Filter rules template saved to: {filepath}")
 
+# A flush is triggered once a batch holds this many rows; it matches the
+# Parquet row-group size so each flush writes one well-sized row group.
+TARGET_ROWS_PER_GROUP = 262144
+
 # Modified main function
 def collect_gdelt_data(
     start_date,
@@ -336,7 +665,9 @@ def collect_gdelt_data(
     columns_to_keep=None,
     output_file='gdelt_events_filtered.parquet',
     batch_size=7,
-    sleep_time=0.5
+    sleep_time=0.5,
+    max_workers=4,
+    rows_per_group=TARGET_ROWS_PER_GROUP
 ):
     """Collect GDELT event records applying optional filters.
 
@@ -357,9 +688,19 @@ def collect_gdelt_data(
         Destination Parquet file. Defaults to
         ``"gdelt_events_filtered.parquet"``.
     batch_size : int, optional
-        Number of days to process before persisting intermediate results.
+        Maximum number of days to hold before persisting intermediate
+        results.
     sleep_time : float, optional
-        Seconds to pause between API requests.
+        Minimum number of seconds between the start of two API requests,
+        enforced across all fetch threads.
+    max_workers : int, optional
+        Number of days fetched concurrently. Results are still filtered and
+        written in date order by the calling thread.
+    rows_per_group : int, optional
+        Flush as soon as the batch holds this many filtered rows, even if
+        fewer than ``batch_size`` days have been collected. Also the
+        maximum Parquet row-group size. Defaults to
+        ``TARGET_ROWS_PER_GROUP``.
 
     Returns
     -------
@@ -375,8 +716,9 @@ def collect_gdelt_data(
     elif filter_rules is None:
         filter_rules = DEFAULT_FILTER_RULES
     
-    # Create filter function
-    filter_function = create_filter_function(filter_rules)
+    # Create filter function; per-rule counts are summarized once at the end
+    filter_stats = {}
+    filter_function = create_filter_function(filter_rules, stats=filter_stats)
     
     # Default columns if not specified
     if columns_to_keep is None:
@@ -389,8 +731,21 @@ def collect_gdelt_data(
             'ActionGeo_ADM1Code', 'ActionGeo_FullName', 'SOURCEURL'
         ]
     
-    # Initialize GDELT
-    gd2 = gdelt.gdelt(version=1)
+    # Each fetch thread gets its own GDELT client
+    thread_state = threading.local()
+    wait_for_slot = _rate_limiter(sleep_time)
+    
+    def fetch_day(date_str):
+        if not hasattr(thread_state, 'client'):
+            thread_state.client = gdelt.gdelt(version=1)
+        wait_for_slot()
+        results = thread_state.client.Search(date_str, table='events', coverage=True)
+        if results is None or len(results) == 0:
+            return None
+        # Project to the kept columns here so the full-width frame is freed
+        # in the worker instead of being held by the pending future
+        available_cols = [col for col in columns_to_keep if col in results.columns]
+        return results[available_cols]
     
     # Generate list of dates
     date_range = pd.date_range(start=start_date, end=end_date, freq='D')
@@ -398,73 +753,88 @@ def collect_gdelt_data(
     
     # Initialize tracking variables
     batch_results = []
-    first_batch = True
+    batch_rows = 0
+    writer = None
+    total_written = 0
+    category_dtypes = dict(_ingest_category_dtypes())
     
     print(f"Starting data collection for {total_dates} days...")
     print(f"Output file: {output_file}")
     print(f"Active filters: {sum(1 for r in filter_rules.values() if r.get('enabled', True))}")
     print("-" * 60)
     
-    # Loop through each date
-    for i, date in enumerate(date_range):
-        date_str = date.strftime('%Y %b %d')
+    date_strs = [date.strftime('%Y %b %d') for date in date_range]
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        # Loop through each date; fetches run ahead in the thread pool
+        fetches = _prefetch_in_order(executor, fetch_day, date_strs, window=max_workers)
+        for i, (date_str, future) in enumerate(fetches):
         
-        try:
-            # Query for single day
-            daily_results = gd2.Search(date_str, table='events', coverage=True)
+            filtered = None
+            try:
+                # Wait for this day's query
+                daily_results = future.result()
             
-            if daily_results is not None and len(daily_results) > 0:
-                # Keep only selected columns
-                available_cols = [col for col in columns_to_keep if col in daily_results.columns]
-                daily_results = daily_results[available_cols]
-                
-                # Apply filters
-                daily_results = filter_function(daily_results)
+                if daily_results is not None:
+                    # Dictionary-encode low-cardinality codes with run-wide dtypes
+                    daily_results = _encode_categories(daily_results, category_dtypes)
                 
-                # Add to batch
-                if len(daily_results) > 0:
-                    batch_results.append(daily_results)
+                    # Apply filters; the unfiltered frame is dropped right away
+                    filtered = filter_function(daily_results)
+                    del daily_results
                 
-                print(f"[{i+1}/{total_dates}] {date_str}: {len(daily_results)} events after filtering")
-            else:
-                print(f"[{i+1}/{total_dates}] {date_str}: No data returned")
-            
-            # Process batch when it reaches size limit or at the end
-            if len(batch_results) >= batch_size or (i == total_dates - 1 and batch_results):
+                    print(f"[{i+1}/{total_dates}] {date_str}: {len(filtered)} events after filtering")
+                else:
+                    print(f"[{i+1}/{total_dates}] {date_str}: No data returned")
+
+            except Exception as e:
+                print(f"[{i+1}/{total_dates}] Error on {date_str}: {e}")
+
+            # Add to batch as an Arrow table with the fixed column types; the
+            # pandas frame is released right away and batches concatenate
+            # zero-copy. Like the flush below, this is outside the per-day
+            # try so a value too wide for its column stops the run.
+            if filtered is not None and len(filtered) > 0:
+                daily_table = pa.Table.from_pandas(filtered, preserve_index=False)
+                batch_results.append(daily_table.cast(_writer_schema(daily_table.schema)))
+                batch_rows += len(filtered)
+            del filtered
+
+            # Process batch when it reaches the day or row limit, or at the end.
+            # This is outside the per-day try: a failed write must stop the
+            # run instead of being retried (and failing) on every later day.
+            if (len(batch_results) >= batch_size or batch_rows >= rows_per_group
+                    or (i == total_dates - 1 and batch_results)):
                 if batch_results:
                     print(f"\n  Processing batch of {len(batch_results)} days...")
-                    
-                    # Combine batch
-                    batch_df = pd.concat(batch_results, ignore_index=True)
-                    
-                    # Optimize dtypes
-                    batch_df = optimize_dtypes(batch_df)
-                    
-                    # Save to file
-                    if first_batch:
-                        batch_df.to_parquet(output_file, compression='snappy', index=False)
-                        first_batch = False
-                        print(f"  Created new file with {len(batch_df)} events")
+
+                    # Combine batch (days are cast to the file schema first,
+                    # which settles columns that were all-null on some days)
+                    schema = writer.schema if writer is not None else _writer_schema(batch_results[0].schema)
+                    batch_table = pa.concat_tables([table.cast(schema) for table in batch_results])
+
+                    # Append to file as a new row group
+                    if writer is None:
+                        writer = pq.ParquetWriter(output_file, schema, compression='snappy')
+                        print(f"  Created new file with {batch_table.num_rows} events")
                     else:
-                        existing_df = pd.read_parquet(output_file)
-                        combined_df = pd.concat([existing_df, batch_df], ignore_index=True)
-                        combined_df.to_parquet(output_file, compression='snappy', index=False)
-                        print(f"  Appended {len(batch_df)} events (total in file: {len(combined_df)})")
-                        del existing_df, combined_df
-                    
-                    # Clear batch
+                        print(f"  Appended {batch_table.num_rows} events (total in file: {total_written + batch_table.num_rows})")
+                    writer.write_table(batch_table, row_group_size=rows_per_group)
+                    total_written += batch_table.num_rows
+
+                    # Clear batch; the Arrow buffers are freed by reference
+                    # counting as soon as the last reference goes away
                     batch_results = []
-                    del batch_df
-                    gc.collect()
-                    
+                    batch_rows = 0
+                    del batch_table
+
                     print("-" * 60)
-            
-            # Sleep to avoid overwhelming API
-            time.sleep(sleep_time)
-            
-        except Exception as e:
-            print(f"[{i+1}/{total_dates}] Error on {date_str}: {e}")
-            continue
+
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        if writer is not None:
+            writer.close()
     
     # Final summary
     print("\n" + "=" * 60)
@@ -472,46 +842,170 @@ def collect_gdelt_data(
     print("=" * 60)
     
     if os.path.exists(output_file):
-        final_df = pd.read_parquet(output_file)
-        print(f"Total events collected: {len(final_df):,}")
+        parquet_file = pq.ParquetFile(output_file)
+        sqldate = parquet_file.read(columns=['SQLDATE']).column('SQLDATE')
+        print(f"Total events collected: {parquet_file.metadata.num_rows:,}")
         print(f"File size: {os.path.getsize(output_file) / (1024*1024):.2f} MB")
-        print(f"Date range: {final_df['SQLDATE'].min()} to {final_df['SQLDATE'].max()}")
+        print(f"Date range: {pc.min(sqldate).as_py()} to {pc.max(sqldate).as_py()}")
+
+    if filter_stats:
+        print("\nFilter rules (rows in -> rows kept, summed over all days):")
+        summary = pd.DataFrame.from_dict(filter_stats, orient='index',
+                                         columns=['rows_in', 'rows_kept'])
+        print(summary.to_string())
+
+def _rate_limiter(interval):
+    """Return a blocking ``wait()`` that spaces calls ``interval`` seconds apart.
+
+    Safe to share between threads: each caller reserves the next free slot
+    under a lock and then sleeps outside it until that slot arrives.
+    """
+    lock = threading.Lock()
+    next_slot = [time.monotonic()]
+
+    def wait():
+        with lock:
+            now = time.monotonic()
+            slot = max(now, next_slot[0])
+            next_slot[0] = slot + interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    return wait
+
+
+def _prefetch_in_order(executor, fn, items, window):
+    """Submit ``fn(item)`` for each item and yield ``(item, future)`` in order.
+
+    At most ``window`` futures are in flight ahead of the consumer, which
+    bounds how many fetched-but-unprocessed days are held in memory.
+    """
+    pending = deque()
+    for item in items:
+        pending.append((item, executor.submit(fn, item)))
+        if len(pending) >= window:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
+
+
+# Arrow types for GDELT's integer columns, sized by what each column can hold
+# rather than by the values seen in one batch. GLOBALEVENTID has passed 2**31
+# and DATEADDED may carry a time (YYYYMMDDHHMMSS), so both stay 64-bit; other
+# integer columns not listed here are written as int64.
+_GDELT_INT_TYPES = {
+    'GLOBALEVENTID': pa.int64(),
+    'DATEADDED': pa.int64(),
+    'SQLDATE': pa.int32(),
+    'MonthYear': pa.int32(),
+    'Year': pa.int32(),
+    'IsRootEvent': pa.int32(),
+    'QuadClass': pa.int32(),
+    'NumMentions': pa.int32(),
+    'NumSources': pa.int32(),
+    'NumArticles': pa.int32(),
+    'Actor1Geo_Type': pa.int32(),
+    'Actor2Geo_Type': pa.int32(),
+    'ActionGeo_Type': pa.int32(),
+}
+
+
+def _writer_schema(schema):
+    """Map an Arrow schema onto the fixed column types used for the file.
+
+    Every day's table is cast to this before it joins a batch, so the types
+    depend on each column's declaration, never on the values one day held.
+    Integer columns (and the declared integer columns, should NaN have
+    turned them to floats) take their width from ``_GDELT_INT_TYPES``
+    (``int64`` if unlisted), other ``float64`` columns become ``float32``,
+    dictionary indices are widened to ``int32``, and all-null columns become
+    strings. A value that does not fit makes the cast raise instead of being
+    wrapped.
+    """
+    fields = []
+    for field in schema:
+        if pa.types.is_integer(field.type) or (
+                field.name in _GDELT_INT_TYPES and pa.types.is_floating(field.type)):
+            field = field.with_type(_GDELT_INT_TYPES.get(field.name, pa.int64()))
+        elif field.type == pa.float64():
+            field = field.with_type(pa.float32())
+        elif pa.types.is_dictionary(field.type):
+            field = field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+        elif pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
 
-def optimize_dtypes(df):
-    """Downcast numeric columns to more efficient dtypes.
+@lru_cache(maxsize=1)
+def _ingest_category_dtypes():
+    """Shared categorical dtypes for code columns, seeded from the lookup tables.
+
+    Giving every day's frame the same ``CategoricalDtype`` keeps
+    ``pd.concat`` on the category path instead of falling back to
+    ``object``.
+
+    Returns
+    -------
+    dict[str, pandas.CategoricalDtype]
+        Column name -> dtype for the actor/geo country codes and CAMEO event
+        codes.
+    """
+    cameo = pd.CategoricalDtype(sorted(load_cameo_country_dict()))
+    fips = pd.CategoricalDtype(sorted(load_fips_dict()))
+    events = pd.CategoricalDtype(sorted(load_cameo_eventcodes_dict()))
+    return {
+        'Actor1CountryCode': cameo,
+        'Actor2CountryCode': cameo,
+        'ActionGeo_CountryCode': fips,
+        'EventCode': events,
+        'EventRootCode': events,
+        'EventBaseCode': events,
+    }
+
+
+def _encode_categories(df, category_dtypes):
+    """Convert string code columns to the run-wide categorical dtypes.
+
+    Codes missing from a dtype's categories (e.g. codes absent from the
+    bundled tables) are appended to it and the updated dtype is stored back
+    in ``category_dtypes``, so no value is ever lost to ``NaN``.
+    Non-string columns are left untouched.
+    """
+    conversions = {}
+    for col, dtype in category_dtypes.items():
+        if col not in df.columns or not pd.api.types.is_string_dtype(df[col]):
+            continue
+        unseen = pd.Index(df[col].dropna().unique()).difference(dtype.categories)
+        if len(unseen) > 0:
+            dtype = pd.CategoricalDtype(dtype.categories.append(unseen))
+            category_dtypes[col] = dtype
+        conversions[col] = dtype
+    return df.astype(conversions) if conversions else df
+
+
+def encode_code_columns(df):
+    """Encode GDELT country and CAMEO code columns as categoricals.
+
+    Applies the same dtypes the collector gives each day as it arrives, so a
+    frame read back from CSV or NDJSON matches what Parquet files written by
+    ``collect_gdelt_data`` already carry. Codes missing from the bundled
+    lookup tables are kept as extra categories.
 
     Parameters
     ----------
     df : pandas.DataFrame
-        DataFrame to optimize in place.
+        GDELT events. Only string code columns that are present are
+        converted.
 
     Returns
     -------
     pandas.DataFrame
-        The optimized DataFrame.
+        ``df`` with the code columns converted, or ``df`` itself if there
+        was nothing to convert.
     """
-    # [Previous optimize_dtypes function remains the same]
-    float_cols = df.select_dtypes(include=['float64']).columns
-    for col in float_cols:
-        df[col] = df[col].astype('float32')
-    
-    int_cols = df.select_dtypes(include=['int64']).columns
-    for col in int_cols:
-        col_min = df[col].min()
-        col_max = df[col].max()
-        if col_min >= -128 and col_max <= 127:
-            df[col] = df[col].astype('int8')
-        elif col_min >= -32768 and col_max <= 32767:
-            df[col] = df[col].astype('int16')
-        elif col_min >= -2147483648 and col_max <= 2147483647:
-            df[col] = df[col].astype('int32')
-    
-    for col in ['Actor1CountryCode', 'Actor2CountryCode', 'ActionGeo_CountryCode', 
-                'EventCode', 'EventRootCode', 'EventBaseCode']:
-        if col in df.columns and df[col].dtype == 'object':
-            df[col] = df[col].astype('category')
-    
-    return df
+    return _encode_categories(df, dict(_ingest_category_dtypes()))
+
 
 def interactive_filter_builder():
     """Prompt the user for filter rules interactively.
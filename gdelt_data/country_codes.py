@@ -19,6 +19,20 @@ CAMEO_EVENTCODES_FILE = os.path.join(_DATA_DIR, "CAMEO.eventcodes.txt")
 # Loaders
 # ---------------------------------------------------------------------------
 
+def _read_tab_pairs(filepath, skip_header=False):
+    """Read ``code<TAB>label`` lines into a dict, stripping both fields.
+
+    The file is read in one call and split in a single pass; blank lines and
+    lines without a tab are ignored.
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    if skip_header:
+        lines = lines[1:]
+    pairs = (line.strip().split("\t", 1) for line in lines)
+    return {pair[0].strip(): pair[1].strip() for pair in pairs if len(pair) == 2}
+
+
 @lru_cache(maxsize=1)
 def load_fips_dict(filepath=None):
     """Load the FIPS code -> country name mapping.
@@ -33,16 +47,7 @@ def load_fips_dict(filepath=None):
     dict[str, str]
         ``{"US": "United States", "GM": "Germany", ...}``
     """
-    filepath = filepath or FIPS_FILE
-    fips = {}
-    with open(filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line and "\t" in line:
-                parts = line.split("\t", 1)
-                if len(parts) == 2:
-                    fips[parts[0].strip()] = parts[1].strip()
-    return fips
+    return _read_tab_pairs(filepath or FIPS_FILE)
 
 
 @lru_cache(maxsize=1)
@@ -59,17 +64,7 @@ def load_cameo_country_dict(filepath=None):
     dict[str, str]
         ``{"USA": "United States", "DEU": "Germany", ...}``
     """
-    filepath = filepath or CAMEO_COUNTRY_FILE
-    cameo = {}
-    with open(filepath, "r", encoding="utf-8") as f:
-        next(f)  # skip header
-        for line in f:
-            line = line.strip()
-            if line and "\t" in line:
-                parts = line.split("\t", 1)
-                if len(parts) == 2:
-                    cameo[parts[0].strip()] = parts[1].strip()
-    return cameo
+    return _read_tab_pairs(filepath or CAMEO_COUNTRY_FILE, skip_header=True)
 
 
 @lru_cache(maxsize=1)
@@ -86,17 +81,7 @@ def load_cameo_eventcodes_dict(filepath=None):
     dict[str, str]
         ``{"01": "MAKE PUBLIC STATEMENT", ...}``
     """
-    filepath = filepath or CAMEO_EVENTCODES_FILE
-    codes = {}
-    with open(filepath, "r", encoding="utf-8") as f:
-        next(f)  # skip header
-        for line in f:
-            line = line.strip()
-            if line and "\t" in line:
-                parts = line.split("\t", 1)
-                if len(parts) == 2:
-                    codes[parts[0].strip()] = parts[1].strip()
-    return codes
+    return _read_tab_pairs(filepath or CAMEO_EVENTCODES_FILE, skip_header=True)
 
 
 # ---------------------------------------------------------------------------
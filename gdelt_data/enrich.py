@@ -2,12 +2,7 @@
 
 import pandas as pd
 
-from .country_codes import (
-    load_cameo_eventcodes_dict,
-    load_fips_dict,
-    load_cameo_country_dict,
-    map_country_names,
-)
+from .country_codes import load_cameo_eventcodes_dict, map_country_names
 
 
 # ---------------------------------------------------------------------------
@@ -102,19 +97,48 @@ def filter_by_country(df, country_code, column="ActionGeo_CountryCode",
 def _convert_gdelt_dates(df):
     """Convert GDELT integer dates to ISO-8601 strings (in-place)."""
     if "SQLDATE" in df.columns:
-        df["SQLDATE"] = pd.to_datetime(
-            df["SQLDATE"].astype(str), format="%Y%m%d", errors="coerce"
-        ).dt.strftime("%Y-%m-%d")
+        df["SQLDATE"] = reformat_dates(df["SQLDATE"], "%Y%m%d", "%Y-%m-%d")
 
     if "DATEADDED" in df.columns:
-        date_str = df["DATEADDED"].astype(str)
+        date_str = df["DATEADDED"].drop_duplicates().astype(str)
         if date_str.str.len().max() > 8:
-            df["DATEADDED"] = pd.to_datetime(
-                date_str, format="%Y%m%d%H%M%S", errors="coerce"
-            ).dt.strftime("%Y-%m-%d %H:%M:%S")
+            df["DATEADDED"] = reformat_dates(
+                df["DATEADDED"], "%Y%m%d%H%M%S", "%Y-%m-%d %H:%M:%S"
+            )
         else:
-            df["DATEADDED"] = pd.to_datetime(
-                date_str, format="%Y%m%d", errors="coerce"
-            ).dt.strftime("%Y-%m-%d")
+            df["DATEADDED"] = reformat_dates(
+                df["DATEADDED"], "%Y%m%d", "%Y-%m-%d"
+            )
 
     return df
+
+
+def reformat_dates(values, input_format, output_format):
+    """Reformat date values, parsing each distinct value only once.
+
+    A day of GDELT events shares a handful of ``SQLDATE`` / ``DATEADDED``
+    values, so the values are factorized, the distinct ones are parsed with
+    ``errors="coerce"`` and formatted, and the results are gathered back to
+    every row.
+
+    Parameters
+    ----------
+    values : pandas.Series
+        Dates as integers or strings, e.g. ``20240115``.
+    input_format : str
+        ``strptime`` format of ``values``, e.g. ``"%Y%m%d"``.
+    output_format : str
+        ``strftime`` format of the result, e.g. ``"%Y-%m-%d"``.
+
+    Returns
+    -------
+    pandas.Series
+        Formatted strings with the index and name of ``values``.
+        Unparseable values become ``NaN``.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    text = pd.Index(uniques).astype(str)
+    formatted = pd.to_datetime(
+        text, format=input_format, errors="coerce"
+    ).strftime(output_format)
+    return pd.Series(formatted.take(codes), index=values.index, name=values.name)
@@ -1,5 +1,6 @@
 """Export GDELT DataFrames to geographic formats."""
 
+import numpy as np
 import pandas as pd
 from xml.sax.saxutils import escape
 
@@ -54,20 +55,35 @@ def to_kml(df, output_file, min_goldstein=None, max_goldstein=None,
     with open(output_file, "w", encoding="utf-8") as f:
         f.write(_KML_HEADER)
 
-        for _, row in df.iterrows():
-            lat = row["ActionGeo_Lat"]
-            lon = row["ActionGeo_Long"]
-            goldstein = row.get("GoldsteinScale", "N/A")
-            event_desc = str(row.get("EventDescription", "N/A"))
-            location = str(row.get("ActionGeo_FullName", "Unknown Location"))
-            source_url = str(row.get("SOURCEURL", "N/A"))
-            date_added = str(row.get("FormattedDate", "N/A"))
-            month_year = str(row.get("MonthYear", "N/A"))
-
-            if goldstein != "N/A":
-                style = "negative" if goldstein < 0 else ("positive" if goldstein > 0 else "neutral")
-            else:
-                style = "neutral"
+        # Classify every placemark's style in one pass; NaN scores compare
+        # False both ways and fall through to neutral.
+        if "GoldsteinScale" in df.columns:
+            score = df["GoldsteinScale"].to_numpy(dtype=float, na_value=np.nan)
+            styles = np.select(
+                [score < 0, score > 0], ["negative", "positive"], "neutral"
+            )
+        else:
+            styles = ["neutral"] * len(df)
+
+        # Walk plain column arrays instead of boxing every row into a Series
+        rows = zip(
+            styles,
+            _column(df, "ActionGeo_Lat"),
+            _column(df, "ActionGeo_Long"),
+            _column(df, "GoldsteinScale", "N/A"),
+            _column(df, "EventDescription", "N/A"),
+            _column(df, "ActionGeo_FullName", "Unknown Location"),
+            _column(df, "SOURCEURL", "N/A"),
+            _column(df, "FormattedDate", "N/A"),
+            _column(df, "MonthYear", "N/A"),
+        )
+        for (style, lat, lon, goldstein, event_desc, location, source_url,
+             date_added, month_year) in rows:
+            event_desc = str(event_desc)
+            location = str(location)
+            source_url = str(source_url)
+            date_added = str(date_added)
+            month_year = str(month_year)
 
             name = f"{event_desc[:50]}..." if len(event_desc) > 50 else event_desc
 
@@ -94,6 +110,13 @@ def to_kml(df, output_file, min_goldstein=None, max_goldstein=None,
     return df
 
 
+def _column(df, name, default=None):
+    """Return ``df[name]`` as an object array, or *default* repeated."""
+    if name in df.columns:
+        return df[name].to_numpy(dtype=object)
+    return [default] * len(df)
+
+
 # ---------------------------------------------------------------------------
 # KML boilerplate
 # ---------------------------------------------------------------------------
@@ -1,13 +1,19 @@
 
+import codecs
 import re
+import threading
 import time
+from collections import OrderedDict
 from typing import Dict, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
+import numpy as np
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .enrich import reformat_dates
 
 try:
     from tqdm import tqdm
@@ -16,11 +22,175 @@ except ImportError:
     TQDM_AVAILABLE = False
     print("Note: Install tqdm for progress bars: pip install tqdm")
 
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Only these tags are ever read, so everything else (body text, scripts,
+# comments) is skipped while parsing. <html> cannot be included without
+# keeping the whole document, so its lang attribute is read with a regex.
+_METADATA_STRAINER = SoupStrainer(['title', 'meta', 'link'])
+_HTML_LANG_RE = re.compile(rb'<html\b[^>]*?\slang\s*=\s*["\']?([^"\'\s>]*)', re.IGNORECASE)
+
+# <meta> name/property -> (metadata field, only fill if still empty).
+# Standard names win, then Open Graph properties, then Twitter card names.
+_META_BY_NAME = {
+    'description': ('description', False),
+    'keywords': ('keywords', False),
+    'author': ('author', False),
+    'language': ('language', False),
+}
+_META_BY_PROPERTY = {
+    'og:title': ('title', True),
+    'og:description': ('description', True),
+    'og:site_name': ('site_name', False),
+    'og:image': ('image', False),
+}
+_META_FALLBACK_BY_NAME = {
+    'twitter:title': ('title', True),
+    'twitter:description': ('description', True),
+    'twitter:image': ('image', True),
+}
+
+def _scan_head(content, charset=None):
+    """
+    Pull the pieces metadata is taken from out of an HTML document: the text
+    of the first <title> (or None), the attribute dict of every <meta> tag,
+    and ``(rel_tokens, href)`` for every <link> tag, in document order.
+    BeautifulSoup parses only the strained tags.
+    """
+    if charset:
+        try:
+            codecs.lookup(charset)
+        except LookupError:
+            charset = None
+
+    soup = BeautifulSoup(content, HTML_PARSER, parse_only=_METADATA_STRAINER,
+                         from_encoding=charset)
+    title_tag = soup.find('title')
+    title = title_tag.get_text() if title_tag is not None else None
+    metas = [tag.attrs for tag in soup.find_all('meta')]
+    links = []
+    for tag in soup.find_all('link'):
+        rel = tag.get('rel', [])
+        if isinstance(rel, str):
+            rel = rel.split()
+        links.append((rel, tag.get('href', '')))
+    return title, metas, links
+
+
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+def _new_session(pool_size=10):
+    """
+    Create a requests Session with keep-alive connection pools holding up to
+    ``pool_size`` connections per host, so concurrent workers reuse TCP/TLS
+    connections instead of opening one per URL.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = _USER_AGENT
+    return session
+
+
+# Shared by direct extract_url_metadata calls that do not pass a session
+_DEFAULT_SESSION = _new_session()
+
+class _LRUCache:
+    """
+    Thread-safe mapping that keeps the ``maxsize`` most recently used entries.
+    Supports the ``get`` / item assignment subset of the dict interface, so
+    it can stand in wherever a plain dict cache is accepted.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# The process-wide conditional-request cache holds at most this many URLs
+METADATA_CACHE_SIZE = 10000
+
+# url -> (etag, last_modified, metadata) for conditional re-fetches
+_CONDITIONAL_CACHE = _LRUCache(METADATA_CACHE_SIZE)
+
+# Pages are streamed and reading stops at </head>; this caps the read for
+# documents whose head never closes.
+HEAD_READ_LIMIT = 256 * 1024
+_HEAD_END_RE = re.compile(rb'</head\s*>', re.IGNORECASE)
+
+
+def _read_head(response, limit=HEAD_READ_LIMIT):
+    """
+    Read a streamed response body up to the end of its <head>, or at most
+    ``limit`` bytes, leaving the rest of the body unread.
+    """
+    buf = bytearray()
+    for chunk in response.iter_content(chunk_size=8192):
+        # Rescan a few bytes of the previous chunk in case the tag is split
+        start = max(0, len(buf) - 8)
+        buf += chunk
+        end = _HEAD_END_RE.search(buf, start)
+        if end:
+            del buf[end.end():]
+            break
+        if len(buf) >= limit:
+            del buf[limit:]
+            break
+    return bytes(buf)
+
 ## Normal URLs version 
-def extract_url_metadata(url: str, timeout: int = 10) -> Dict[str, Optional[str]]:
+def extract_url_metadata(url: str, timeout: int = 10, cache: Optional[dict] = None,
+                         session: Optional[requests.Session] = None,
+                         max_bytes: int = HEAD_READ_LIMIT) -> Dict[str, Optional[str]]:
     """
     Extract metadata from a webpage URL including title, description, and other relevant information.
+
+    Successful results for pages that send an ETag or Last-Modified header are
+    kept in ``cache`` (by default a module-level cache of the
+    ``METADATA_CACHE_SIZE`` most recently used URLs). Fetching the same URL
+    again sends If-None-Match / If-Modified-Since, and a 304 Not Modified
+    reply returns the cached metadata without downloading or parsing the page.
+
+    Requests go through ``session`` (a shared module-level Session by
+    default), so connections to a host are kept alive and reused.
+
+    At most ``max_bytes`` of the body are read, so each call holds a bounded
+    amount of page data however large the document is.
     """
+    if session is None:
+        session = _DEFAULT_SESSION
+    if cache is None:
+        cache = _CONDITIONAL_CACHE
+    cached = cache.get(url)
+    validators = None
+
     metadata = {
         'url': url,
         'title': None,
@@ -38,67 +208,77 @@ def extract_url_metadata(url: str, timeout: int = 10) -> Dict[str, Optional[str]
     }
 
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
-        response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-        metadata['status_code'] = response.status_code
-        metadata['content_type'] = response.headers.get('content-type', '')
-
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, 'html.parser')
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        # Stream so only the head of the page is downloaded; leaving the
+        # with-block closes the connection on the unread remainder
+        with session.get(url, headers=headers, timeout=timeout,
+                         allow_redirects=True, stream=True) as response:
+            metadata['status_code'] = response.status_code
+            metadata['content_type'] = response.headers.get('content-type', '')
+
+            if response.status_code == 304 and cached:
+                return dict(cached[2])
+
+            response.raise_for_status()
+
+            # PDFs, images and other non-HTML bodies carry no page metadata;
+            # return before any of the body is read or parsed
+            content_type = metadata['content_type']
+            if content_type and 'html' not in content_type.lower():
+                metadata['error'] = 'non-html'
+                return {k: v if v else None for k, v in metadata.items()}
+
+            validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            content = _read_head(response, max_bytes)
+
+        # A charset declared in Content-Type is authoritative, so hand it to
+        # the parser rather than letting it sniff the bytes. Without one
+        # the document's own <meta charset> still has to be detected.
+        charset = _CHARSET_RE.search(metadata['content_type'])
+        title, meta_tags, links = _scan_head(content, charset.group(1) if charset else None)
 
         # Extract title
-        title_tag = soup.find('title')
-        if title_tag:
-            metadata['title'] = title_tag.get_text().strip()
+        if title is not None:
+            metadata['title'] = title.strip()
 
         # Extract meta tags
-        meta_tags = soup.find_all('meta')
-
         for tag in meta_tags:
-            if tag.get('name', '').lower() == 'description':
-                metadata['description'] = tag.get('content', '').strip()
-            elif tag.get('name', '').lower() == 'keywords':
-                metadata['keywords'] = tag.get('content', '').strip()
-            elif tag.get('name', '').lower() == 'author':
-                metadata['author'] = tag.get('content', '').strip()
-            elif tag.get('name', '').lower() == 'language':
-                metadata['language'] = tag.get('content', '').strip()
-            elif tag.get('property', '').lower() == 'og:title' and not metadata['title']:
-                metadata['title'] = tag.get('content', '').strip()
-            elif tag.get('property', '').lower() == 'og:description' and not metadata['description']:
-                metadata['description'] = tag.get('content', '').strip()
-            elif tag.get('property', '').lower() == 'og:site_name':
-                metadata['site_name'] = tag.get('content', '').strip()
-            elif tag.get('property', '').lower() == 'og:image':
-                metadata['image'] = tag.get('content', '').strip()
-            elif tag.get('name', '').lower() == 'twitter:title' and not metadata['title']:
-                metadata['title'] = tag.get('content', '').strip()
-            elif tag.get('name', '').lower() == 'twitter:description' and not metadata['description']:
-                metadata['description'] = tag.get('content', '').strip()
-            elif tag.get('name', '').lower() == 'twitter:image' and not metadata['image']:
-                metadata['image'] = tag.get('content', '').strip()
+            name = tag.get('name', '').lower()
+            prop = tag.get('property', '').lower()
+
+            # Candidates in precedence order; the first applicable one wins
+            for rule in (_META_BY_NAME.get(name), _META_BY_PROPERTY.get(prop),
+                         _META_FALLBACK_BY_NAME.get(name)):
+                if rule is None:
+                    continue
+                field, only_if_missing = rule
+                if only_if_missing and metadata[field]:
+                    continue
+                metadata[field] = tag.get('content', '').strip()
+                break
 
         # Extract canonical URL
-        canonical_link = soup.find('link', {'rel': 'canonical'})
-        if canonical_link:
-            metadata['canonical_url'] = canonical_link.get('href', '').strip()
+        canonical_href = next((href for rel, href in links if 'canonical' in rel), None)
+        if canonical_href is not None:
+            metadata['canonical_url'] = canonical_href.strip()
 
-        # Extract favicon
-        favicon_link = soup.find('link', {'rel': 'icon'}) or soup.find('link', {'rel': 'shortcut icon'})
-        if favicon_link:
-            favicon_href = favicon_link.get('href', '')
-            if favicon_href:
-                metadata['favicon'] = urljoin(url, favicon_href)
+        # Extract favicon ("shortcut icon" also carries the icon token)
+        favicon_href = next((href for rel, href in links if 'icon' in rel), None)
+        if favicon_href:
+            metadata['favicon'] = urljoin(url, favicon_href)
 
         # Extract language from html tag if not found in meta
         if not metadata['language']:
-            html_tag = soup.find('html')
-            if html_tag:
-                metadata['language'] = html_tag.get('lang', '').strip()
+            html_lang = _HTML_LANG_RE.search(content)
+            if html_lang:
+                metadata['language'] = html_lang.group(1).decode('ascii', 'ignore').strip()
 
         # Convert relative URLs to absolute
         if metadata['image'] and not metadata['image'].startswith(('http://', 'https://')):
@@ -115,11 +295,103 @@ def extract_url_metadata(url: str, timeout: int = 10) -> Dict[str, Optional[str]
     # Clean up empty values
     metadata = {k: v if v else None for k, v in metadata.items()}
 
+    if validators and any(validators) and not metadata['error']:
+        cache[url] = (*validators, dict(metadata))
+
     return metadata
 
 ## TODO Add URL content scraper 
 
 
+def _per_host_limiter(interval):
+    """
+    Return a blocking ``wait(url)`` that spaces requests to the same host
+    ``interval`` seconds apart, while requests to different hosts proceed
+    without waiting on each other.
+
+    Safe to share between threads: each caller reserves its host's next free
+    slot under a lock and then sleeps outside it until that slot arrives.
+    """
+    lock = threading.Lock()
+    next_slot = {}
+
+    def wait(url):
+        host = urlparse(url).netloc
+        with lock:
+            now = time.monotonic()
+            slot = max(now, next_slot.get(host, now))
+            next_slot[host] = slot + interval
+        pause = slot - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+
+    return wait
+
+
+def _completed_in_pool(fn, items, max_workers):
+    """
+    Run ``fn`` over ``items`` in a thread pool, yielding ``(item, future)``
+    pairs as requests finish (with a tqdm progress bar if available).
+
+    All items are submitted up front, so the pool stays saturated with
+    in-flight requests while results are consumed.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_item = {executor.submit(fn, item): item for item in items}
+
+        futures_iter = as_completed(future_to_item)
+        if TQDM_AVAILABLE:
+            futures_iter = tqdm(futures_iter, total=len(future_to_item),
+                                desc="Extracting metadata", unit="url")
+
+        for future in futures_iter:
+            yield future_to_item[future], future
+
+
+def _unique_per_url(df, column, urls, limit=None, join=True):
+    """
+    Distinct non-null values of ``column`` for each SOURCEURL in ``urls``, in
+    order of first appearance and optionally capped at ``limit`` per URL.
+
+    Returns a Series indexed like ``urls`` holding ``' | '``-joined strings
+    (``''`` when a URL has no values), or lists when ``join`` is False.
+    """
+    pairs = df[['SOURCEURL', column]].dropna().drop_duplicates()
+    if limit:
+        pairs = pairs[pairs.groupby('SOURCEURL', observed=True, sort=False).cumcount() < limit]
+
+    # Stable sort the pairs by URL and slice the value array per URL
+    codes, keys = pd.factorize(pairs['SOURCEURL'])
+    order = np.argsort(codes, kind='stable')
+    values = pairs[column].to_numpy(dtype=object)[order]
+    bounds = np.cumsum(np.bincount(codes, minlength=len(keys)))[:-1]
+    chunks = np.split(values, bounds) if len(keys) else []
+
+    if join:
+        joined = pd.Series([' | '.join(chunk) for chunk in chunks], index=keys)
+        return joined.reindex(urls, fill_value='')
+    result = pd.Series([list(chunk) for chunk in chunks], index=keys, dtype=object).reindex(urls)
+    return result.apply(lambda v: v if isinstance(v, list) else [])
+
+
+def _format_sqldate(sqldate):
+    """
+    Format a Series of YYYYMMDD SQLDATE values as ``YYYY-MM-DD`` strings.
+
+    Integer dates are split with integer arithmetic instead of being parsed
+    to datetime64 and formatted back; other dtypes go through ``to_datetime``.
+    """
+    if not pd.api.types.is_integer_dtype(sqldate):
+        return pd.to_datetime(sqldate, format='%Y%m%d').dt.strftime('%Y-%m-%d')
+
+    values = sqldate.to_numpy()
+    year = (values // 10000).astype(str)
+    month = np.char.zfill(((values // 100) % 100).astype(str), 2)
+    day = np.char.zfill((values % 100).astype(str), 2)
+    iso = np.char.add(np.char.add(np.char.add(np.char.add(year, '-'), month), '-'), day)
+    return pd.Series(iso, index=sqldate.index, name=sqldate.name)
+
+
 ## Gdelt verison 
 def get_source_urls_with_metadata(df, actor1_code=None, actor2_code=None, geo_code=None,
                                  match_type='any', limit=None, show_events=True,
@@ -138,8 +410,9 @@ def get_source_urls_with_metadata(df, actor1_code=None, actor2_code=None, geo_co
     - show_events: Whether to include event descriptions (True/False)
     - extract_metadata: Whether to extract webpage metadata (True/False)
     - max_workers: Number of concurrent threads for metadata extraction
-    - delay: Delay between requests in seconds (to be respectful)
-    - timeout: Request timeout in seconds
+    - delay: Minimum delay in seconds between requests to the same host (to be respectful)
+    - timeout: Request timeout in seconds (URLs fetched before in this process are
+      revalidated with a conditional request, so unchanged pages are not parsed again)
     - dataF: Return a DataFrame with full event details and metadata
 
     Returns:
@@ -152,30 +425,25 @@ def get_source_urls_with_metadata(df, actor1_code=None, actor2_code=None, geo_co
     # Build conditions
     conditions = []
 
-    if actor1_code:
-        conditions.append(df['Actor1CountryCode'] == actor1_code)
-    if actor2_code:
-        conditions.append(df['Actor2CountryCode'] == actor2_code)
-    if geo_code:
-        conditions.append(df['ActionGeo_CountryCode'] == geo_code)
+    for column, code in (('Actor1CountryCode', actor1_code),
+                         ('Actor2CountryCode', actor2_code),
+                         ('ActionGeo_CountryCode', geo_code)):
+        if code:
+            conditions.append((df[column] == code).to_numpy(dtype=bool, na_value=False))
 
     # Apply conditions or use entire dataset if no filters specified
     if not conditions:
         print("No filters specified. Processing entire dataset...")
-        filtered_df = df.copy()
+        filtered_df = df
     else:
-        # Apply conditions based on match_type
+        # Apply conditions based on match_type in a single reduction
         if match_type == 'any':
-            mask = conditions[0]
-            for condition in conditions[1:]:
-                mask = mask | condition
+            mask = np.logical_or.reduce(conditions)
         else:  # 'all'
-            mask = conditions[0]
-            for condition in conditions[1:]:
-                mask = mask & condition
+            mask = np.logical_and.reduce(conditions)
 
-        # Filter dataframe
-        filtered_df = df[mask].copy()
+        # Filter dataframe (read-only below, so no defensive copy)
+        filtered_df = df[mask]
 
     # Check if we have any data to process
     if len(filtered_df) == 0:
@@ -184,59 +452,44 @@ def get_source_urls_with_metadata(df, actor1_code=None, actor2_code=None, geo_co
             return pd.DataFrame()
         return []
 
+    # Resolved once per call; the per-group aggregations below don't re-check
+    has_desc = 'EventDescription' in filtered_df.columns
+
     if dataF:
         # Aggregate GDELT variables by URL
         print("Aggregating GDELT events by URL...")
 
-        # Convert SQLDATE to datetime first for aggregation
-        filtered_df['SQLDATE_dt'] = pd.to_datetime(filtered_df['SQLDATE'], format='%Y%m%d')
-
-        # Define aggregation functions for each column
-        agg_dict = {
-            'GoldsteinScale': ['mean', 'min', 'max', 'std', 'count'],  # Multiple stats for sentiment
-            'Actor1Name': lambda x: ' | '.join(x.dropna().unique()[:5]),  # Top 5 unique actors
-            'Actor2Name': lambda x: ' | '.join(x.dropna().unique()[:5]),  # Top 5 unique actors
-            'Actor1CountryCode': lambda x: ' | '.join(x.dropna().unique()),  # All unique countries
-            'Actor2CountryCode': lambda x: ' | '.join(x.dropna().unique()),  # All unique countries
-            'ActionGeo_CountryCode': lambda x: ' | '.join(x.dropna().unique()),  # All unique locations
-            'SQLDATE_dt': ['min', 'max'],  # Date range
-            'EventDescription': lambda x: list(x.dropna().unique()) if 'EventDescription' in filtered_df.columns else []
-        }
-
-        # Perform aggregation
-        result_df = filtered_df.groupby('SOURCEURL').agg(agg_dict).reset_index()
-
-        # Flatten column names
-        result_df.columns = ['_'.join(col).strip('_') if col[1] else col[0]
-                           for col in result_df.columns.values]
-
-        # Rename columns for clarity
-        column_mapping = {
-            'GoldsteinScale_mean': 'avg_goldstein_score',
-            'GoldsteinScale_min': 'min_goldstein_score',
-            'GoldsteinScale_max': 'max_goldstein_score',
-            'GoldsteinScale_std': 'goldstein_score_std',
-            'GoldsteinScale_count': 'event_count',
-            'Actor1Name_<lambda>': 'actor1_names',
-            'Actor2Name_<lambda>': 'actor2_names',
-            'Actor1CountryCode_<lambda>': 'actor1_countries',
-            'Actor2CountryCode_<lambda>': 'actor2_countries',
-            'ActionGeo_CountryCode_<lambda>': 'event_locations',
-            'SQLDATE_dt_min': 'first_event_date',
-            'SQLDATE_dt_max': 'last_event_date',
-            'EventDescription_<lambda>': 'event_descriptions'
-        }
-
-        # Apply column mapping
-        for old_col, new_col in column_mapping.items():
-            if old_col in result_df.columns:
-                result_df = result_df.rename(columns={old_col: new_col})
-
-        # Convert dates to string format
-        if 'first_event_date' in result_df.columns:
-            result_df['first_event_date'] = result_df['first_event_date'].dt.strftime('%Y-%m-%d')
-        if 'last_event_date' in result_df.columns:
-            result_df['last_event_date'] = result_df['last_event_date'].dt.strftime('%Y-%m-%d')
+        # Numeric and date statistics use pandas' built-in (C-level)
+        # group reductions. observed=True keeps a categorical SOURCEURL from
+        # producing empty groups for URLs that were filtered out.
+        grouped = filtered_df.groupby('SOURCEURL', observed=True)
+        result_df = grouped.agg(
+            avg_goldstein_score=('GoldsteinScale', 'mean'),  # Multiple stats for sentiment
+            min_goldstein_score=('GoldsteinScale', 'min'),
+            max_goldstein_score=('GoldsteinScale', 'max'),
+            goldstein_score_std=('GoldsteinScale', 'std'),
+            event_count=('GoldsteinScale', 'count'),
+        )
+
+        # Distinct-value summaries are built from de-duplicated
+        # (url, value) pairs rather than a Python lambda per group
+        urls = result_df.index
+        result_df['actor1_names'] = _unique_per_url(filtered_df, 'Actor1Name', urls, limit=5)  # Top 5 unique actors
+        result_df['actor2_names'] = _unique_per_url(filtered_df, 'Actor2Name', urls, limit=5)  # Top 5 unique actors
+        result_df['actor1_countries'] = _unique_per_url(filtered_df, 'Actor1CountryCode', urls)  # All unique countries
+        result_df['actor2_countries'] = _unique_per_url(filtered_df, 'Actor2CountryCode', urls)  # All unique countries
+        result_df['event_locations'] = _unique_per_url(filtered_df, 'ActionGeo_CountryCode', urls)  # All unique locations
+        # YYYYMMDD values order like the dates they encode, so the range is
+        # taken on the raw column and only the per-URL results are formatted
+        dates_by_url = filtered_df['SQLDATE'].groupby(filtered_df['SOURCEURL'], observed=True, sort=False)
+        result_df['first_event_date'] = _format_sqldate(dates_by_url.min())  # Date range
+        result_df['last_event_date'] = _format_sqldate(dates_by_url.max())
+        if has_desc:
+            result_df['event_descriptions'] = _unique_per_url(filtered_df, 'EventDescription', urls, join=False)
+        else:
+            result_df['event_descriptions'] = [[] for _ in range(len(result_df))]
+
+        result_df = result_df.reset_index()
 
         # Add derived metrics
         if 'first_event_date' in result_df.columns and 'last_event_date' in result_df.columns:
@@ -263,23 +516,13 @@ def get_source_urls_with_metadata(df, actor1_code=None, actor2_code=None, geo_co
             metadata_results = []
             urls = result_df['SOURCEURL'].unique()
 
-            def extract_with_delay(url):
-                time.sleep(delay)
-                return extract_url_metadata(url, timeout)
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_url = {executor.submit(extract_with_delay, url): url
-                               for url in urls}
+            wait_for_host = _per_host_limiter(delay)
+            with _new_session(pool_size=max_workers) as session:
+                def extract_with_delay(url):
+                    wait_for_host(url)
+                    return extract_url_metadata(url, timeout, session=session)
 
-                # Use tqdm progress bar if available
-                if TQDM_AVAILABLE:
-                    futures_iter = tqdm(as_completed(future_to_url), total=len(urls),
-                                       desc="Extracting metadata", unit="url")
-                else:
-                    futures_iter = as_completed(future_to_url)
-
-                for future in futures_iter:
-                    url = future_to_url[future]
+                for url, future in _completed_in_pool(extract_with_delay, urls, max_workers):
                     try:
                         metadata = future.result()
                         metadata_results.append(metadata)
@@ -338,13 +581,15 @@ def get_source_urls_with_metadata(df, actor1_code=None, actor2_code=None, geo_co
 
     elif show_events:
         # Group by URL and get unique event descriptions and first date
-        url_events = filtered_df.groupby('SOURCEURL').agg({
-            'EventDescription': lambda x: list(x.dropna().unique()) if 'EventDescription' in filtered_df.columns else [],
-            'SQLDATE': 'first'
-        }).reset_index()
+        agg_dict = {'SQLDATE': 'first'}
+        if has_desc:
+            agg_dict = {'EventDescription': lambda x: list(x.dropna().unique()), **agg_dict}
+        url_events = filtered_df.groupby('SOURCEURL', observed=True).agg(agg_dict).reset_index()
+        if not has_desc:
+            url_events.insert(1, 'EventDescription', [[] for _ in range(len(url_events))])
 
         # Convert SQLDATE to cosmograph-friendly format (YYYY-MM-DD)
-        url_events['SQLDATE'] = pd.to_datetime(url_events['SQLDATE'], format='%Y%m%d').dt.strftime('%Y-%m-%d')
+        url_events['SQLDATE'] = _format_sqldate(url_events['SQLDATE'])
 
         # Add event count for sorting
         url_events['event_count'] = url_events['EventDescription'].apply(len)
@@ -359,26 +604,21 @@ def get_source_urls_with_metadata(df, actor1_code=None, actor2_code=None, geo_co
         if extract_metadata:
             print(f"Extracting metadata for {len(url_events)} URLs...")
 
-            def extract_metadata_with_context(row):
-                time.sleep(delay)
-                url, events, date = row['SOURCEURL'], row['EventDescription'], row['SQLDATE']
-                metadata = extract_url_metadata(url, timeout)
-                return (url, events, date, metadata)
-
-            results_with_metadata = []
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [executor.submit(extract_metadata_with_context, row)
-                          for _, row in url_events.iterrows()]
-
-                # Use tqdm progress bar if available
-                if TQDM_AVAILABLE:
-                    futures_iter = tqdm(as_completed(futures), total=len(futures),
-                                       desc="Extracting metadata", unit="url")
-                else:
-                    futures_iter = as_completed(futures)
-
-                for future in futures_iter:
+            wait_for_host = _per_host_limiter(delay)
+            with _new_session(pool_size=max_workers) as session:
+                def extract_metadata_with_context(row):
+                    url, events, date = row
+                    wait_for_host(url)
+                    metadata = extract_url_metadata(url, timeout, session=session)
+                    return (url, events, date, metadata)
+
+                results_with_metadata = []
+
+                # Plain (url, events, date) tuples; no per-row Series is built
+                rows = zip(url_events['SOURCEURL'].tolist(),
+                           url_events['EventDescription'].tolist(),
+                           url_events['SQLDATE'].tolist())
+                for _, future in _completed_in_pool(extract_metadata_with_context, rows, max_workers):
                     try:
                         result = future.result()
                         results_with_metadata.append(result)
@@ -403,23 +643,15 @@ def get_source_urls_with_metadata(df, actor1_code=None, actor2_code=None, geo_co
         if extract_metadata:
             print(f"Extracting metadata for {len(urls)} URLs...")
 
-            def extract_with_delay(url):
-                time.sleep(delay)
-                return (url, extract_url_metadata(url, timeout))
+            wait_for_host = _per_host_limiter(delay)
+            with _new_session(pool_size=max_workers) as session:
+                def extract_with_delay(url):
+                    wait_for_host(url)
+                    return (url, extract_url_metadata(url, timeout, session=session))
 
-            results_with_metadata = []
+                results_with_metadata = []
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [executor.submit(extract_with_delay, url) for url in urls]
-
-                # Use tqdm progress bar if available
-                if TQDM_AVAILABLE:
-                    futures_iter = tqdm(as_completed(futures), total=len(futures),
-                                       desc="Extracting metadata", unit="url")
-                else:
-                    futures_iter = as_completed(futures)
-
-                for future in futures_iter:
+                for _, future in _completed_in_pool(extract_with_delay, urls, max_workers):
                     try:
                         result = future.result()
                         results_with_metadata.append(result)
@@ -487,33 +719,29 @@ def combine_multiple_columns(df, column_names, new_col_name='combined_text',
         The original dataframe with the new combined column added
     """
 
-    # Create a copy to avoid modifying the original dataframe
-    result_df = df.copy()
-
     # Validate column names
     for col_name in column_names:
         if col_name not in df.columns:
             raise ValueError(f"Column '{col_name}' not found in dataframe")
 
-    def format_content(row):
-        """Format the content for a single row"""
-        parts = []
-
-        for col_name in column_names:
-            val = row[col_name]
-            if pd.notna(val) and str(val).strip():
-                if include_labels:
-                    parts.append(f"{col_name}: {val}")
-                else:
-                    parts.append(str(val))
+    # Build the text column by column with vectorized string ops instead of
+    # formatting one row at a time
+    combined = pd.Series('', index=df.index)
+    started = pd.Series(False, index=df.index)
+    for col_name in column_names:
+        column = df[col_name].astype(object)
+        present = column.notna()
+        text = column.where(present, '').astype(str)
+        keep = present & (text.str.strip() != '')
+        if include_labels:
+            text = f"{col_name}: " + text
 
         # Join parts with separator
-        return separator.join(parts) if parts else ""
+        combined = combined.mask(keep & started, combined + separator + text)
+        combined = combined.mask(keep & ~started, text)
+        started |= keep
 
-    # Apply the formatting function to create the new column
-    result_df[new_col_name] = df.apply(format_content, axis=1)
-
-    return result_df
+    return df.assign(**{new_col_name: combined})
 
 def map_event_codes(df, event_dict, verbose=True):
     """
@@ -526,21 +754,32 @@ def map_event_codes(df, event_dict, verbose=True):
 
     Returns:
     DataFrame: DataFrame with cleaned EventCode and new EventDescription column
+    (rows with a missing EventCode keep it missing and get no description)
     """
-    # Create a copy to avoid modifying original
-    result_df = df.copy()
-
-    # Clean and convert EventCode to string
-    if result_df['EventCode'].dtype in ['int64', 'int32', 'float64']:
-        result_df['EventCode'] = result_df['EventCode'].astype(int).astype(str)
+    # Clean and convert EventCode to string (only this column is copied).
+    # There are only a few hundred CAMEO codes, so numeric codes are
+    # factorized and just the distinct values are converted to strings.
+    # factorize marks missing codes with position -1; they stay missing in
+    # both output columns instead of picking up the last code's entry.
+    if df['EventCode'].dtype in ['int64', 'int32', 'float64']:
+        positions, uniques = pd.factorize(df['EventCode'])
+        uniques = uniques.astype(int).astype(str)
+        missing = positions < 0
+        labels = uniques.to_numpy(dtype=object)[positions]
+        labels[missing] = None
+        event_codes = pd.Series(labels, index=df.index, name='EventCode')
     else:
-        result_df['EventCode'] = result_df['EventCode'].astype(str).str.strip()
+        event_codes = df['EventCode'].astype(str).str.strip()
+        positions, uniques = pd.factorize(event_codes)
+        missing = positions < 0
 
     if verbose:
         # Diagnostic information
-        print(f"\nEventCode data type: {result_df['EventCode'].dtype}")
+        print(f"\nEventCode data type: {event_codes.dtype}")
         print("Sample EventCodes from your data:")
-        print(result_df['EventCode'].value_counts().head())
+        print(event_codes.value_counts().head())
+        if missing.any():
+            print(f"Missing EventCodes: {np.count_nonzero(missing)} rows (left without a description)")
 
     # Create a mapping function that tries multiple formats
     def map_code(code):
@@ -569,8 +808,13 @@ def map_event_codes(df, event_dict, verbose=True):
 
         return None
 
-    # Map the event descriptions with intelligent padding
-    result_df['EventDescription'] = result_df['EventCode'].apply(map_code)
+    # Map the event descriptions with intelligent padding, resolving each
+    # distinct code once and gathering the results by position
+    descriptions = np.array([map_code(code) for code in uniques.astype(str)], dtype=object)
+    descriptions = descriptions[positions]
+    descriptions[missing] = None
+    result_df = df.assign(EventCode=event_codes,
+                          EventDescription=pd.Series(descriptions, index=df.index))
 
     if verbose:
         # Show mapping success rate
@@ -587,6 +831,10 @@ def map_event_codes(df, event_dict, verbose=True):
 
     return result_df
 
+_CAMEO_SPLIT_RE = re.compile(r'\s{2,}')
+_CAMEO_LINE_RE = re.compile(r'(\S+)\s+(.+)')
+
+
 def parse_cameo_codes(file_path):
     """Parse the CAMEO codes file and return a dictionary mapping codes to descriptions"""
 
@@ -595,7 +843,7 @@ def parse_cameo_codes(file_path):
         content = f.read()
 
     # Split into lines and skip the header
-    lines = content.strip().split('\n')[1:]  # Skip header line
+    lines = content.strip().splitlines()[1:]  # Skip header line
 
     event_dict = {}
 
@@ -609,7 +857,7 @@ def parse_cameo_codes(file_path):
 
         # Split by multiple spaces to separate code from description
         # Use regex to split on 2+ spaces to handle the formatting
-        parts = re.split(r'\s{2,}', line, 1)
+        parts = _CAMEO_SPLIT_RE.split(line, 1)
 
         if len(parts) == 2:
             code = parts[0].strip()
@@ -618,7 +866,7 @@ def parse_cameo_codes(file_path):
         else:
             # Handle cases where there might be different spacing
             # Split on first space sequence and take first part as code
-            match = re.match(r'(\S+)\s+(.+)', line)
+            match = _CAMEO_LINE_RE.match(line)
             if match:
                 code = match.group(1).strip()
                 description = match.group(2).strip()
@@ -655,31 +903,19 @@ def convert_dates_to_iso(df, inplace=False):
 
     # Convert SQLDATE (YYYYMMDD format) to ISO 8601 date
     if 'SQLDATE' in df.columns:
-        df['SQLDATE'] = pd.to_datetime(
-            df['SQLDATE'].astype(str),
-            format='%Y%m%d',
-            errors='coerce'
-        ).dt.strftime('%Y-%m-%d')
+        df['SQLDATE'] = reformat_dates(df['SQLDATE'], '%Y%m%d', '%Y-%m-%d')
 
     # Convert DATEADDED (YYYYMMDD or YYYYMMDDHHMMSS format) to ISO 8601
     if 'DATEADDED' in df.columns:
         # Check the length of the date string to determine format
-        date_str = df['DATEADDED'].astype(str)
+        date_str = df['DATEADDED'].drop_duplicates().astype(str)
         max_len = date_str.str.len().max()
 
         if max_len > 8:
             # Full datetime format (YYYYMMDDHHMMSS)
-            df['DATEADDED'] = pd.to_datetime(
-                date_str,
-                format='%Y%m%d%H%M%S',
-                errors='coerce'
-            ).dt.strftime('%Y-%m-%d %H:%M:%S')
+            df['DATEADDED'] = reformat_dates(df['DATEADDED'], '%Y%m%d%H%M%S', '%Y-%m-%d %H:%M:%S')
         else:
             # Date only format (YYYYMMDD)
-            df['DATEADDED'] = pd.to_datetime(
-                date_str,
-                format='%Y%m%d',
-                errors='coerce'
-            ).dt.strftime('%Y-%m-%d')
+            df['DATEADDED'] = reformat_dates(df['DATEADDED'], '%Y%m%d', '%Y-%m-%d')
 
     return df
\ No newline at end of file